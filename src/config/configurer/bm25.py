@@ -1,7 +1,10 @@
 import asyncio
 import datetime
+import itertools
 import logging
-import string
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from uuid import UUID
 
@@ -9,9 +12,9 @@ from dependency_injector.wiring import inject
 from docling.document_converter import DocumentConverter
 from langchain_community.retrievers import BM25Retriever
 from langchain_core.documents import Document
-from langchain_experimental.text_splitter import SemanticChunker
+from rank_bm25 import BM25Okapi
 
-from .embeddings import EmbeddingsConfigurerImpl
+from .embeddings import EmbeddingsConfigurerImpl, get_semantic_chunker
 from .interface.bm25 import BM25Configurer
 from .vector_store import VectorStoreConfigurerImpl
 from ..model.retriever.bm25 import BM25Configuration
@@ -19,14 +22,36 @@ from ...data.base_model import DocumentSource
 from ...provide import DocumentRepositoryProvide, FileServiceProvide
 from ...service.interface.file import IFileService
 from ...util import TextPreprocessing
+from ...util.constant import EnvVar
 from ...util.function import get_config_folder_path, get_datetime_now
 
+_converter: DocumentConverter | None = None
+
 
 @inject
 def _get_document_repository(repository: DocumentRepositoryProvide):
     return repository
 
 
+def _get_converter() -> DocumentConverter:
+    # Init for using at the first time, the loaded models are reused by later conversions in the same worker
+    global _converter
+    if _converter is None:
+        _converter = DocumentConverter()
+    return _converter
+
+
+def _convert_document(path: str) -> tuple[str, int]:
+    """
+    Converts a document to Markdown. It is run in the worker processes, each
+    worker loads its converter once and reuses it for the documents it gets.
+    Only the exported content and the number of pages are returned.
+    """
+    converter = _get_converter()
+    result = converter.convert(path)
+    return result.document.export_to_markdown(), len(result.pages)
+
+
 @inject
 async def _get_file_metadata_by_id(file_id: UUID, file_service: FileServiceProvide):
     file = await file_service.get_metadata_by_id(file_id)
@@ -36,6 +61,7 @@ async def _get_file_metadata_by_id(file_id: UUID, file_service: FileServiceProvi
 
 
 class BM25ConfigurerImpl(BM25Configurer):
+    __slots__ = ("_config", "_retriever", "_last_sync")
     _config: BM25Configuration | None
     _retriever: BM25Retriever | None
     _last_sync: datetime.datetime | None
@@ -48,8 +74,11 @@ class BM25ConfigurerImpl(BM25Configurer):
         self._last_sync = None
 
     def configure(self, config: BM25Configuration, /, **kwargs):
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.async_configure(config, **kwargs))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.async_configure(config, **kwargs))
+        raise RuntimeError("Use async_configure() from within an event loop.")
 
     async def async_configure(self, config: BM25Configuration, /, **kwargs):
         self._logger.info("Configuring BM25 retriever...")
@@ -61,16 +90,17 @@ class BM25ConfigurerImpl(BM25Configurer):
 
         vs_configurer: VectorStoreConfigurerImpl = kwargs["vs_configurer"]
 
-        # Configures Embeddings model
+        # Configures Embeddings model while fetching documents, they do not depend on each other.
+        # The model is constructed in a worker thread, so the query runs in the meantime.
         embeddings_configurer: EmbeddingsConfigurerImpl = kwargs["embeddings_configurer"]
         embeddings_config = config.embeddings_model
-        await embeddings_configurer.async_configure(embeddings_config)
+        document_repository = _get_document_repository()
+        _, db_docs = await asyncio.gather(embeddings_configurer.async_configure(embeddings_config),
+                                          document_repository.get_all_vs_embedded())
         embeddings_model = embeddings_configurer.get_model(embeddings_config.name)
         if embeddings_model is None:
             raise ValueError(f'No {config.embeddings_model} embeddings model has configured yet.')
 
-        document_repository = _get_document_repository()
-        db_docs = await document_repository.get_all_vs_embedded()
         if len(db_docs) <= 0:
             self._logger.info("No document for initializing BM25 retriever. Skipping...")
             return
@@ -81,19 +111,29 @@ class BM25ConfigurerImpl(BM25Configurer):
             async with asyncio.TaskGroup() as group:
                 for doc in documents:
                     file_metadata_tasks.append(group.create_task(_get_file_metadata_by_id(doc.file_id)))
-            files: list[IFileService.FileMetadata] = list(filter(
-                lambda p: p is not None, [t.result() for t in file_metadata_tasks]))
-
-            converter = DocumentConverter()
-            results = converter.convert_all([file.path for file in files])
-            return [Document(page_content=result.document.export_to_markdown(),
+            files: list[IFileService.FileMetadata] = [file for t in file_metadata_tasks
+                                                      if (file := t.result()) is not None]
+
+            if len(files) == 0:
+                return []
+
+            # Converting is CPU-heavy, so it runs in worker processes to not block the event loop
+            loop = asyncio.get_running_loop()
+            max_workers = int(os.getenv(EnvVar.BM25_MAX_WORKERS.value, "2"))
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_get_converter) as pool:
+                results = await asyncio.gather(*[
+                    loop.run_in_executor(pool, _convert_document, file.path) for file in files
+                ])
+            return [Document(page_content=content,
                              metadata={"source": file.name,
                                        "id": str(file.id),
-                                       "total_pages": len(result.pages),
+                                       "total_pages": total_pages,
                                        "mime_type": file.mime_type,
                                        "path": file.path
                                        })
-                    for file, result in zip(files, results)]
+                    for file, (content, total_pages) in zip(files, results)]
 
         async def get_from_external_docs(documents: list):
             self._logger.debug('Collecting chunks from external documents.')
@@ -109,13 +149,15 @@ class BM25ConfigurerImpl(BM25Configurer):
                         continue
                     chunk_ids = [chunk.id for chunk in doc.chunks]
                     doc_tasks.append(group.create_task(vector_store.aget_by_ids(chunk_ids)))
-            documents: list[Document] = []
-            for t in doc_tasks:
-                documents += t.result()
-            return documents
-
-        uploaded_docs = list(filter(lambda doc: doc.source == DocumentSource.UPLOADED, db_docs))
-        external_docs = list(filter(lambda doc: doc.source == DocumentSource.EXTERNAL, db_docs))
+            return list(itertools.chain.from_iterable(t.result() for t in doc_tasks))
+
+        docs_by_source: dict[DocumentSource, list] = {DocumentSource.UPLOADED: [], DocumentSource.EXTERNAL: []}
+        for db_doc in db_docs:
+            bucket = docs_by_source.get(db_doc.source)
+            if bucket is not None:
+                bucket.append(db_doc)
+        uploaded_docs = docs_by_source[DocumentSource.UPLOADED]
+        external_docs = docs_by_source[DocumentSource.EXTERNAL]
         chunk_tasks: list[asyncio.Task[list[Document]]] = []
         async with asyncio.TaskGroup() as tg:
             if len(uploaded_docs) > 0:
@@ -125,47 +167,42 @@ class BM25ConfigurerImpl(BM25Configurer):
 
         # Chunking documents
         if len(chunk_tasks) > 0:
-            chunker = SemanticChunker(embeddings_model)
-            docs: list[Document] = []
-            for task in chunk_tasks:
-                docs += task.result()
+            chunker = get_semantic_chunker(embeddings_model)
+            docs: list[Document] = list(itertools.chain.from_iterable(t.result() for t in chunk_tasks))
             chunks = chunker.split_documents(docs)
 
             removal_words_file_path = Path(get_config_folder_path(),
                                            config.removal_words_path) if config.removal_words_path else None
             helper = TextPreprocessing(removal_words_file_path) if removal_words_file_path else None
 
-            def preprocess(text: str) -> list[str]:
-                normalized_text = (text.lower()  # make to lower case
-                                   .translate(str.maketrans('', '', string.punctuation)))  # remove punctuations
-                if config.enable_remove_emoji:
-                    normalized_text = TextPreprocessing.remove_emoji(normalized_text)
-                if config.enable_remove_emoticon:
-                    normalized_text = TextPreprocessing.remove_emoticons(normalized_text)
-                if helper:
-                    normalized_text = helper.remove_words(normalized_text)
-                return normalized_text.split()
+            # Punctuations and emoji are stripped in a single pass
+            preprocess = TextPreprocessing.build_tokenizer(remove_emoji=config.enable_remove_emoji,
+                                                           remove_emoticons=config.enable_remove_emoticon,
+                                                           helper=helper)
+
+            def build_retriever():
+                # Tokenise the corpus once, `preprocess` is only applied to queries afterward
+                corpus = [preprocess(chunk.page_content) for chunk in chunks]
+                return BM25Retriever(vectorizer=BM25Okapi(corpus),
+                                     docs=chunks,
+                                     k=config.k,
+                                     preprocess_func=preprocess)
 
             self._logger.debug(f'Constructing BM25 retriever from retrieved chunks...')
-            self._retriever = BM25Retriever.from_documents(documents=chunks,
-                                                           preprocess_func=preprocess,
-                                                           k=config.k)
+            self._retriever = await asyncio.to_thread(build_retriever)
             self._config = config
-            self._logger.info("Configured BM25 retriever successfully.")
-
-            async def update_document_bm25_status():
-                for doc in db_docs:
-                    doc.embed_bm25 = True
-                await document_repository.save_all(db_docs)
-
-            asyncio.create_task(update_document_bm25_status())
             self._last_sync = get_datetime_now()
+            await document_repository.mark_bm25_embedded([doc.id for doc in db_docs])
+            self._logger.info("Configured BM25 retriever successfully.")
         else:
             self._logger.info("No chunks for initializing BM25 retriever. Skipping...")
 
     def destroy(self, **kwargs):
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.async_destroy(**kwargs))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.async_destroy(**kwargs))
+        raise RuntimeError("Use async_destroy() from within an event loop.")
 
     async def async_destroy(self, **kwargs):
         pass
@@ -2,12 +2,35 @@ import asyncio
 import logging
 
 from langchain_core.embeddings import Embeddings
+from langchain_experimental.text_splitter import SemanticChunker
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_huggingface import HuggingFaceEmbeddings
 
 from .interface.embeddings import EmbeddingsConfigurer
 from ..model.embeddings import EmbeddingsConfiguration, EmbeddingsType
 
+# Embeddings models are not hashable, so chunkers are keyed by the model identity.
+# The model is kept alongside its chunker to make sure the identity is not reused.
+_chunkers: dict[int, tuple[Embeddings, SemanticChunker]] = {}
+
+
+def get_semantic_chunker(embeddings: Embeddings) -> SemanticChunker:
+    """
+    Returns a `SemanticChunker` for the given embeddings model, reusing the one
+    created before for the same model instance.
+    """
+    cached = _chunkers.get(id(embeddings))
+    if cached is not None and cached[0] is embeddings:
+        return cached[1]
+    chunker = SemanticChunker(embeddings)
+    _chunkers[id(embeddings)] = (embeddings, chunker)
+    return chunker
+
+
+def clear_semantic_chunkers():
+    """Drops all cached chunkers, e.g. when embeddings models are reconfigured."""
+    _chunkers.clear()
+
 
 class EmbeddingsConfigurerImpl(EmbeddingsConfigurer):
     _embeddings: dict[str, tuple[EmbeddingsConfiguration, Embeddings]] | None = None
@@ -22,17 +45,22 @@ class EmbeddingsConfigurerImpl(EmbeddingsConfigurer):
         if self._embeddings is None:
             self._embeddings = {}
 
+        # Loading the model weights is blocking, so it is done in a worker thread
+        model = await asyncio.to_thread(self._create_model, config)
+        self._embeddings[config.name] = (config, model)
+        self._logger.debug("Configured embeddings model successfully.")
+
+    @staticmethod
+    def _create_model(config: EmbeddingsConfiguration) -> Embeddings:
         if config.type == EmbeddingsType.HUGGING_FACE:
-            model = HuggingFaceEmbeddings(model_name=config.model_name)
+            return HuggingFaceEmbeddings(model_name=config.model_name)
         elif config.type == EmbeddingsType.GOOGLE_GENAI:
             task_type = str(config.task_type.value) if config.task_type is not None else None
-            model = GoogleGenerativeAIEmbeddings(model=config.model_name, task_type=task_type)
+            return GoogleGenerativeAIEmbeddings(model=config.model_name, task_type=task_type)
         # elif config.type == EmbeddingsType.OLLAMA:
-        #     model = OllamaEmbeddings(model=config.model_name, base_url=config.base_url)
+        #     return OllamaEmbeddings(model=config.model_name, base_url=config.base_url)
         else:
             raise NotImplementedError(f'{type(config)} is not supported.')
-        self._embeddings[config.name] = (config, model)
-        self._logger.debug("Configured embeddings model successfully.")
 
     def destroy(self, **kwargs):
         loop = asyncio.get_event_loop()
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 
 class Configurer(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def configure(self, **kwargs):
@@ -21,8 +22,8 @@ class Configurer(ABC):
 
 
 class RetrieverConfigurer(Configurer, ABC):
-    pass
+    __slots__ = ()
 
 
 class ToolConfigurer(Configurer, ABC):
-    pass
+    __slots__ = ()
@@ -9,10 +9,14 @@ from ...model.retriever.bm25 import BM25Configuration
 
 
 class BM25Configurer(RetrieverConfigurer):
+    __slots__ = ()
 
     def configure(self, config: BM25Configuration, /, **kwargs):
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.async_configure(config, **kwargs))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.async_configure(config, **kwargs))
+        raise RuntimeError("Use async_configure() from within an event loop.")
 
     async def async_configure(self, config: BM25Configuration, /, **kwargs):
         """
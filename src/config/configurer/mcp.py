@@ -1,15 +1,50 @@
 import logging
 from datetime import timedelta
+from typing import Callable
 
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langchain_mcp_adapters.sessions import StdioConnection, StreamableHttpConnection
 
 from src.config.configurer.interface.mcp import MCPConfigurer
-from src.config.model.mcp import MCPConfiguration, MCPTransport
+from src.config.model.mcp import MCPConfiguration, MCPTransport, StreamableConnectionConfiguration, \
+    StdioConnectionConfiguration
 
 SupportedConnection = StdioConnection | StreamableHttpConnection
 
 
+def _build_streamable_http(cfg: StreamableConnectionConfiguration) -> StreamableHttpConnection:
+    return StreamableHttpConnection(
+        transport="streamable_http",
+        url=cfg.url,
+        headers=cfg.headers,
+        timeout=timedelta(seconds=cfg.timeout),
+        sse_read_timeout=timedelta(seconds=cfg.sse_read_timeout),
+        terminate_on_close=cfg.terminate_on_close,
+        session_kwargs=None,
+        httpx_client_factory=None)
+
+
+def _build_stdio(cfg: StdioConnectionConfiguration) -> StdioConnection:
+    return StdioConnection(
+        transport="stdio",
+        command=cfg.command,
+        args=cfg.args,
+        env=cfg.env,
+        cwd=cfg.cwd,
+        encoding=cfg.encoding,
+        encoding_error_handler=cfg.encoding_error_handler,
+        session_kwargs=None)
+
+
+ConnectionBuilder = (Callable[[StreamableConnectionConfiguration], StreamableHttpConnection]
+                     | Callable[[StdioConnectionConfiguration], StdioConnection])
+
+_BUILDERS: dict[MCPTransport, ConnectionBuilder] = {
+    MCPTransport.STREAMABLE_HTTP: _build_streamable_http,
+    MCPTransport.STDIO: _build_stdio,
+}
+
+
 class MCPConfigurerImpl(MCPConfigurer):
     _config: MCPConfiguration | None = None
     _client: MultiServerMCPClient | None = None
@@ -20,29 +55,11 @@ class MCPConfigurerImpl(MCPConfigurer):
 
         connections: dict[str, SupportedConnection] = {}
         for server, cfg in config.connections.items():
-            if cfg.type == MCPTransport.STREAMABLE_HTTP:
-                conn = StreamableHttpConnection(
-                    transport="streamable_http",
-                    url=cfg.url,
-                    headers=cfg.headers,
-                    timeout=timedelta(seconds=cfg.timeout),
-                    sse_read_timeout=timedelta(seconds=cfg.sse_read_timeout),
-                    terminate_on_close=cfg.terminate_on_close,
-                    session_kwargs=None,
-                    httpx_client_factory=None)
-            elif cfg.type == MCPTransport.STDIO:
-                conn = StdioConnection(
-                    transport="stdio",
-                    command=cfg.command,
-                    args=cfg.args,
-                    env=cfg.env,
-                    cwd=cfg.cwd,
-                    encoding=cfg.encoding,
-                    encoding_error_handler=cfg.encoding_error_handler,
-                    session_kwargs=None)
-            else:
+            try:
+                build_connection = _BUILDERS[cfg.type]
+            except KeyError:
                 raise ValueError(f'Unsupported connection type: {type(cfg)}')
-            connections[server] = conn
+            connections[server] = build_connection(cfg)
         self._client = MultiServerMCPClient(connections)
 
     async def async_configure(self, config, /, **kwargs):
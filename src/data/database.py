@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 
 from sqlalchemy import URL, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 class IDatabaseConnection(ABC):
@@ -25,6 +27,36 @@ class IDatabaseConnection(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def create_async_session(self) -> AsyncSession:
+        """
+        Creates and returns a new sqlmodel AsyncSession object.
+
+        This function initializes an `AsyncSession` using the async `engine`, queries
+        executed by it do not block the event loop while waiting for the database.
+
+        **Important: ** It is crucial to close the session after it has been used
+        to release database connections and resources, preferably by using an
+        `async with` statement. Loaded objects are not expired on commit, since they
+        cannot be refreshed implicitly outside the session.
+
+        Returns:
+            AsyncSession: A new SQLAlchemy AsyncSession object.
+        Raises:
+            NotImplementedError: If this method is not implemented in a subclass.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def async_dispose(self) -> None:
+        """
+        Disposes the async engine, closing all of its pooled connections.
+
+        Raises:
+            NotImplementedError: If this method is not implemented in a subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def create_db_and_tables(self) -> None:
         """
@@ -49,6 +81,7 @@ class IDatabaseConnection(ABC):
 
 class DatabaseConnection(IDatabaseConnection):
     _engine: Engine
+    _async_engine: AsyncEngine
     url: URL
 
     def __init__(self, host, port, database, user, password):
@@ -64,6 +97,7 @@ class DatabaseConnection(IDatabaseConnection):
     def __enter__(self):
         print(f"Connecting to database url: {self.url.render_as_string(hide_password=True)}")
         self._engine = create_engine(self.url)
+        self._async_engine = create_async_engine(self.url, pool_pre_ping=True)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -73,6 +107,12 @@ class DatabaseConnection(IDatabaseConnection):
     def create_session(self):
         return Session(self._engine)
 
+    def create_async_session(self):
+        return AsyncSession(self._async_engine, expire_on_commit=False)
+
+    async def async_dispose(self):
+        await self._async_engine.dispose()
+
     def create_db_and_tables(self):
         SQLModel.metadata.create_all(self._engine)
 
@@ -1,21 +1,29 @@
+from typing import Callable, Awaitable, Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
 
 from .base_model import BaseImage, BaseLabel, BaseDocument, BaseThread
 
+# Shared constrained types, the same validation schema is reused by every model using them
+Name255 = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+Name150 = Annotated[str, StringConstraints(min_length=1, max_length=150)]
+Text255 = Annotated[str, StringConstraints(max_length=255)]
+MimeType150 = Annotated[str, StringConstraints(max_length=150)]
+NonEmptyBytes = Annotated[bytes, Field(min_length=1)]
+
 
 class LabelPublic(BaseLabel):
     id: int
 
 
 class LabelCreate(BaseModel):
-    name: str = Field(min_length=1, max_length=255)
-    description: str | None = Field(default=None, max_length=255)
+    name: Name255
+    description: Text255 | None = None
 
 
 class LabelUpdate(BaseModel):
-    description: str | None = Field(default=None, max_length=255)
+    description: Text255 | None = None
 
 
 class LabelDelete(BaseModel):
@@ -24,9 +32,9 @@ class LabelDelete(BaseModel):
 
 
 class ImageCreate(BaseModel):
-    name: str = Field(min_length=1, max_length=255)
-    mime_type: str | None = Field(default=None, max_length=150)
-    data: bytes = Field(min_length=1)
+    name: Name255
+    mime_type: MimeType150 | None = None
+    read: Callable[[int], Awaitable[bytes]] = Field(description="Async function reading the image content.")
 
 
 class ImagePublic(BaseImage):
@@ -38,10 +46,10 @@ class ImagePublic(BaseImage):
 
 
 class DocumentCreate(BaseModel):
-    name: str = Field(min_length=1, max_length=150)
-    description: str | None = Field(default=None, max_length=255)
-    mime_type: str | None = Field(default=None, max_length=150)
-    data: bytes = Field(min_length=1)
+    name: Name150
+    description: Text255 | None = None
+    mime_type: MimeType150 | None = None
+    data: NonEmptyBytes
 
 
 class DocumentPublic(BaseDocument):
@@ -68,8 +76,8 @@ class ThreadPublic(BaseThread):
 
 
 class ThreadCreate(BaseModel):
-    title: str = Field(min_length=1, max_length=255)
+    title: Name255
 
 
 class ThreadUpdate(BaseModel):
-    title: str = Field(min_length=1, max_length=255)
+    title: Name255
@@ -51,7 +51,7 @@ class Image(BaseImage, table=True):
                                                                   lazy="selectin",
                                                                   cascade="delete-orphan, save-update, delete"))
     file_id: UUID = Field(description="Image file", index=True, foreign_key="file.id", nullable=False)
-    file: File = Relationship(back_populates="image")
+    file: File = Relationship(back_populates="image", sa_relationship_kwargs={"lazy": "selectin"})
 
 
 class LabeledImage(SQLModel, table=True):
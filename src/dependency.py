@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Annotated
 
 from dependency_injector.wiring import Provide
@@ -16,6 +17,7 @@ from .util import SecureDownloadGenerator, PagingParams
 from .util.constant import EnvVar
 
 
+@lru_cache(maxsize=1)
 def provide_download_generator():
     secret_key = os.getenv(EnvVar.DOWNLOAD_GENERATOR_SECRET_KEY.value, "your-super-secret-key-change-in-production")
     return SecureDownloadGenerator(secret_key)
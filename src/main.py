@@ -8,7 +8,7 @@ from dependency_injector import providers
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import ORJSONResponse, FileResponse
 
 from src.config.configurer.agent import AgentConfigurerImpl
 from src.container import ApplicationContainer
@@ -141,10 +141,12 @@ async def lifespan(api: FastAPI):
     yield
 
     await agent.shutdown()
+    await container.db_connection().async_dispose()
     await shutdown_application_container(container)
 
 
-app = FastAPI(lifespan=lifespan, debug=logging_level == logging.DEBUG)
+# orjson serializes datetime and UUID values natively, it is faster than the standard JSON encoder
+app = FastAPI(lifespan=lifespan, debug=logging_level == logging.DEBUG, default_response_class=ORJSONResponse)
 # noinspection PyTypeChecker
 app.add_middleware(
     CORSMiddleware,
@@ -174,7 +176,7 @@ async def download(token: str, generator: DownloadGeneratorDepend):
 # noinspection PyUnusedLocal
 @app.exception_handler(NotFoundError)
 async def not_found_exception_handler(request: Request, exc: NotFoundError):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={"message": exc.reason},
     )
@@ -183,7 +185,7 @@ async def not_found_exception_handler(request: Request, exc: NotFoundError):
 # noinspection PyUnusedLocal
 @app.exception_handler(InvalidArgumentError)
 async def invalid_argument_exception_handler(request: Request, exc: InvalidArgumentError):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={"message": exc.reason},
     )
@@ -1,5 +1,6 @@
+import asyncio
 from abc import abstractmethod, ABC
-from typing import TypedDict, Iterable
+from typing import TypedDict, Iterable, Sequence
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -20,13 +21,11 @@ class RecognizerOutput(BaseModel):
     @field_validator("classes", mode="after")
     @classmethod
     def remove_classes_duplicate(cls, classes: list[ClassDescriptor]):
-        class_names = set()
-        nodup_classes: list[ClassDescriptor] = []
+        # Dictionaries preserve insertion order, `setdefault` keeps the first class of each name
+        nodup_classes: dict[str, ClassDescriptor] = {}
         for data_class in classes:
-            if data_class.name not in class_names:
-                class_names.add(data_class.name)
-                nodup_classes.append(data_class)
-        return nodup_classes
+            nodup_classes.setdefault(data_class.name, data_class)
+        return list(nodup_classes.values())
 
 
 class RecognizingResult(TypedDict):
@@ -41,9 +40,41 @@ class Recognizer(ABC):
     """
 
     @abstractmethod
-    def predict(self, **kwargs) -> RecognizingResult:
+    def predict(self, data, **kwargs) -> RecognizingResult:
+        """
+        Predicts a single input.
+
+        :param data: The input to predict.
+        :return: The recognizing result.
+        """
         pass
 
     @abstractmethod
-    async def async_predict(self, **kwargs) -> RecognizingResult:
+    async def async_predict(self, data, **kwargs) -> RecognizingResult:
+        """
+        Asynchronously predicts a single input.
+
+        :param data: The input to predict.
+        :return: The recognizing result.
+        """
         pass
+
+    def predict_batch(self, inputs: Sequence, **kwargs) -> list[RecognizingResult]:
+        """
+        Predicts a batch of inputs. Implementations should override it to run a single
+        batched inference, by default the inputs are predicted one by one.
+
+        :param inputs: The inputs to predict.
+        :return: The results, in the same order as the inputs.
+        """
+        return [self.predict(data, **kwargs) for data in inputs]
+
+    async def async_predict_batch(self, inputs: Sequence, **kwargs) -> list[RecognizingResult]:
+        """
+        Asynchronously predicts a batch of inputs. By default, the inputs are predicted concurrently
+        by using ``async_predict``.
+
+        :param inputs: The inputs to predict.
+        :return: The results, in the same order as the inputs.
+        """
+        return list(await asyncio.gather(*[self.async_predict(data, **kwargs) for data in inputs]))
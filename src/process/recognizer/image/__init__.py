@@ -24,6 +24,8 @@ from src.util.function import get_config_folder_path, is_web_path
 
 __all__ = ["get_transform_layer", "ImageRecognizer"]
 
+MAX_BATCH_SIZE = 32
+
 
 def get_transform_layer(config: ImagePreprocessingConfiguration) -> torch.nn.Module:
     if isinstance(config, ImageResizeConfiguration):
@@ -195,28 +197,71 @@ class ImageRecognizer(Recognizer):
         :raises FileNotFoundError: If the image cannot be correctly processed into a compatible format.
         :raises HTTPError: If the provided URL fails to fetch the image.
         """
+        return self.predict_batch([image], use_min_probability)[0]
+
+    def predict_batch(self,
+                      inputs: Sequence[str | np.ndarray | PILImage.Image],
+                      use_min_probability: bool = True, **kwargs) -> list[RecognizingResult]:
+        """
+        Predict the classes and their respective probabilities for a batch of images.
+        Images of the same size after preprocessing are stacked and run through the model
+        in a single forward pass, in chunks of at most ``MAX_BATCH_SIZE`` images.
+
+        :param inputs: Input images, each one can be a file path (str), URL (str), or an instance of
+            ``np.ndarray`` or ``PIL.Image``.
+        :param use_min_probability: If True, filters results, according to the minimum
+            class probability threshold defined in the configuration. Defaults to True.
+        :return: A list of ``RecognizingResult``, in the same order as the inputs. The inference time
+            of each result is the time spent on the batch the image belongs to.
+        :raises RuntimeError: If the recognizer is not properly initialized before calling
+            this method.
+        :raises FileNotFoundError: If an image cannot be correctly processed into a compatible format.
+        :raises HTTPError: If a provided URL fails to fetch the image.
+        """
         if not self.is_initialized or self._model is None:
             raise RuntimeError("Recognizer is not properly initialized.")
 
-        model = self._model
-        start_time = time.time()
-
-        # Preprocess
+        results: list[RecognizingResult] = []
+        for offset in range(0, len(inputs), MAX_BATCH_SIZE):
+            start_time = time.time()
+            input_tensors = [self.preprocess_image(self._load_image(image))
+                             for image in inputs[offset:offset + MAX_BATCH_SIZE]]
+            batch_probs = self._infer(input_tensors)
+            inference_time = time.time() - start_time
+            results.extend(self._to_result(probs, use_min_probability, inference_time) for probs in batch_probs)
+        return results
+
+    @staticmethod
+    def _load_image(image: str | np.ndarray | PILImage.Image) -> np.ndarray | PILImage.Image:
         if isinstance(image, str):
             if is_web_path(image):
                 response = requests.get(image)
                 response.raise_for_status()
                 byte_data = BytesIO(response.content)
-                image = PILImage.open(fp=byte_data, mode="r").convert(mode="RGB")
-            else:
-                image = PILImage.open(fp=image, mode="r").convert(mode="RGB")
-        input_tensor = self.preprocess_image(image)
+                return PILImage.open(fp=byte_data, mode="r").convert(mode="RGB")
+            return PILImage.open(fp=image, mode="r").convert(mode="RGB")
+        return image
+
+    def _infer(self, input_tensors: list[torch.Tensor]) -> list[list[float]]:
+        """
+        Runs the model on preprocessed images. The tensors are concatenated into one batch
+        when they have the same shape, otherwise each one is run on its own.
 
-        # Inference
+        Returns:
+            The class probabilities of each image.
+        """
+        model = self._model
         with torch.no_grad():
-            output: torch.Tensor = model(input_tensor)
-        flatten_probs: list[float] = torch.sigmoid(output).cpu().numpy().flatten().tolist()
+            if all(tensor.shape == input_tensors[0].shape for tensor in input_tensors):
+                outputs = [model(torch.cat(input_tensors, dim=0))]
+            else:
+                outputs = [model(tensor) for tensor in input_tensors]
+        return [row.flatten().tolist()
+                for output in outputs
+                for row in torch.sigmoid(output).cpu().numpy()]
 
+    def _to_result(self, flatten_probs: list[float], use_min_probability: bool,
+                   inference_time: float) -> RecognizingResult:
         zip_result = zip(self._output_classes, flatten_probs)
         if use_min_probability:
             min_prob = self._config.min_probability
@@ -233,7 +278,7 @@ class ImageRecognizer(Recognizer):
         max_results = self._config.max_results
         return RecognizingResult(probabilities=probabilities[:max_results],
                                  classes=classes[:max_results],
-                                 inference_time=time.time() - start_time)
+                                 inference_time=inference_time)
 
     async def async_predict(self,
                             image: str | np.ndarray | PILImage.Image,
@@ -259,3 +304,13 @@ class ImageRecognizer(Recognizer):
         """
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(self._executor, self.predict, image, use_min_probability)
+
+    async def async_predict_batch(self,
+                                  inputs: Sequence[str | np.ndarray | PILImage.Image],
+                                  use_min_probability: bool = True, **kwargs) -> list[RecognizingResult]:
+        """
+        Asynchronously predict a batch of images, the batched inference is run in the worker threads.
+        See ``predict_batch`` for details.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, self.predict_batch, inputs, use_min_probability)
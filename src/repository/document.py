@@ -1,6 +1,7 @@
+from typing import Iterable
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import update, func
 from sqlmodel import select
 
 from . import RepositoryImpl
@@ -19,37 +20,29 @@ class DocumentRepositoryImpl(IDocumentRepository, RepositoryImpl):
 
     async def get_all(self) -> list[Document]:
         with self._connection.create_session() as session:
-            return list(session.exec(select(Document)).all())
+            return session.exec(select(Document)).all()
 
     # noinspection PyComparisonWithNone
     async def get_all_vs_embedded(self) -> list[Document]:
         with self._connection.create_session() as session:
             stmt = select(Document).where(Document.embed_to_vs != None)
-            return list(session.exec(stmt).all())
+            return session.exec(stmt).all()
 
     async def get_embedded(self, params: PagingParams) -> PagingWrapper[Document]:
         with self._connection.create_session() as session:
-            count_stmt = (select(func.count(func.distinct(Document.id)))
-                          .select_from(Document)
-                          .join(DocumentChunk, DocumentChunk.document_id == Document.id))
-            exec_stmt = (select(Document)
-                         .distinct()
-                         .join(DocumentChunk, DocumentChunk.document_id == Document.id)
+            exec_stmt = (select(Document, func.count().over().label("total_elements"))
+                         .where(Document.id.in_(select(DocumentChunk.document_id)))
                          .offset((params.offset * params.limit))
                          .limit(params.limit)
                          .order_by(Document.created_at))
             return PagingWrapper.get_paging(
                 params=params,
                 execute_statement=exec_stmt,
-                count_statement=count_stmt,
                 session=session)
 
     async def get_unembedded(self, params: PagingParams) -> PagingWrapper[Document]:
         with self._connection.create_session() as session:
-            count_stmt = (select(func.count())
-                          .outerjoin_from(Document, DocumentChunk, DocumentChunk.document_id == Document.id)
-                          .where(DocumentChunk.document_id == None))
-            exec_stmt = (select(Document)
+            exec_stmt = (select(Document, func.count().over().label("total_elements"))
                          .join(DocumentChunk, DocumentChunk.document_id == Document.id, isouter=True)
                          .where(DocumentChunk.document_id == None)
                          .offset((params.offset * params.limit))
@@ -58,9 +51,17 @@ class DocumentRepositoryImpl(IDocumentRepository, RepositoryImpl):
             return PagingWrapper.get_paging(
                 params=params,
                 execute_statement=exec_stmt,
-                count_statement=count_stmt,
                 session=session)
 
+    # noinspection PyUnresolvedReferences
+    async def mark_bm25_embedded(self, document_ids: Iterable[UUID]) -> None:
+        with self._connection.create_session() as session:
+            stmt = (update(Document)
+                    .where(Document.id.in_(document_ids))
+                    .values(embed_bm25=True))
+            session.exec(stmt)
+            session.commit()
+
     async def delete_chunks(self, chunks: list[DocumentChunk]) -> None:
         with self._connection.create_session() as session:
             for chunk in chunks:
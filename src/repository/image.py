@@ -26,11 +26,7 @@ class ImageRepositoryImpl(IImageRepository, RepositoryImpl):
                         .having(func.count(LabeledImage.label_id) == len(params.label_ids))
                         .subquery())
 
-            count_statement = (select(func.count())
-                               .select_from(Image)
-                               .where(Image.id.in_(select(subquery.c.image_id))))
-
-            statement = (select(Image)
+            statement = (select(Image, func.count().over().label("total_elements"))
                          .where(Image.id.in_(select(subquery.c.image_id)))
                          .offset(params.offset * params.limit)
                          .limit(params.limit)
@@ -38,17 +34,12 @@ class ImageRepositoryImpl(IImageRepository, RepositoryImpl):
 
             return PagingWrapper.get_paging(
                 params=params,
-                count_statement=count_statement,
                 execute_statement=statement,
                 session=session)
 
     async def get_unlabeled(self, params: PagingParams) -> PagingWrapper[Image]:
         with self._connection.create_session() as session:
-            count_statement = (select(func.count())
-                               .outerjoin_from(Image, LabeledImage, LabeledImage.image_id == Image.id)
-                               .where(LabeledImage.label_id == None))
-
-            statement = (select(Image)
+            statement = (select(Image, func.count().over().label("total_elements"))
                          .join(LabeledImage, LabeledImage.image_id == Image.id, isouter=True)
                          .where(LabeledImage.label_id == None)
                          .offset(params.offset)
@@ -56,25 +47,19 @@ class ImageRepositoryImpl(IImageRepository, RepositoryImpl):
                          .order_by(Image.created_at))
             return PagingWrapper.get_paging(
                 params=params,
-                count_statement=count_statement,
                 execute_statement=statement,
                 session=session
             )
 
     async def get_labeled(self, params: PagingParams) -> PagingWrapper[Image]:
         with self._connection.create_session() as session:
-            count_statement = (select(func.count(func.distinct(Image.id)))
-                               .select_from(Image)
-                               .join(LabeledImage, LabeledImage.image_id == Image.id))
-            statement = (select(Image)
-                         .distinct()
-                         .join(LabeledImage, LabeledImage.image_id == Image.id)
+            statement = (select(Image, func.count().over().label("total_elements"))
+                         .where(Image.id.in_(select(LabeledImage.image_id)))
                          .offset((params.offset * params.limit))
                          .limit(params.limit)
                          .order_by(Image.created_at))
             return PagingWrapper.get_paging(
                 params=params,
-                count_statement=count_statement,
                 execute_statement=statement,
                 session=session)
 
@@ -83,11 +68,11 @@ class ImageRepositoryImpl(IImageRepository, RepositoryImpl):
             get_all_images_stmt = (select(Image)
                                    .join(LabeledImage, LabeledImage.image_id == Image.id)
                                    .where(LabeledImage.label_id == label_id))
-            return list(session.exec(get_all_images_stmt).all())
+            return session.exec(get_all_images_stmt).all()
 
     async def get_all_images_with_labels(self) -> list[tuple[Label, Image]]:
         with self._connection.create_session() as session:
             get_all_used_labels_stmt = (select(Label, Image)
                                         .join(LabeledImage, LabeledImage.label_id == Label.id)
                                         .join(Image, LabeledImage.image_id == Image.id))
-            return list(session.exec(get_all_used_labels_stmt).all())
+            return session.exec(get_all_used_labels_stmt).all()
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import Iterable
 from uuid import UUID
 
 from src.data.model import Document, DocumentChunk
@@ -68,6 +69,19 @@ class IDocumentRepository(IRepository[UUID, Document]):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def mark_bm25_embedded(self, document_ids: Iterable[UUID]) -> None:
+        """
+        Marks the documents with the given IDs as embedded to the BM25 index.
+
+        The update is issued as a single bulk `UPDATE` statement instead of
+        saving each document separately.
+
+        :param document_ids: IDs of the documents to be marked.
+        :raises NotImplementedError: If the method is not implemented in a subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_chunks(self, chunks: list[DocumentChunk]) -> None:
         """
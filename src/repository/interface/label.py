@@ -67,6 +67,7 @@ class ILabelRepository(IRepository[int, Label]):
 
         :param image: The image object to which labels will be assigned.
         :param label_ids: A list of label IDs that need to be assigned to the image.
+        :raises NotFoundError: If any of the label IDs does not exist.
         :raises NotImplementedError: If the method is not implemented in the subclass.
         """
         raise NotImplementedError
@@ -1,55 +1,69 @@
 from typing import Iterable
 from uuid import UUID
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
 from . import RepositoryImpl
 from .interface.label import ILabelRepository
 from ..data.model import Label, LabeledImage, Image
+from ..util.error import NotFoundError
+from ..util.function import get_datetime_now
 
 
 # noinspection PyTypeChecker
 class LabelRepositoryImpl(ILabelRepository, RepositoryImpl):
 
     async def get_by_id(self, entity_id: UUID) -> Label | None:
-        with self._connection.create_session() as session:
-            entity = session.get(Label, entity_id)
+        async with self._connection.create_async_session() as session:
+            entity = await session.get(Label, entity_id)
             return entity
 
     async def get_all_by_image_id(self, image_id: UUID) -> list[Label]:
-        with self._connection.create_session() as session:
+        async with self._connection.create_async_session() as session:
             statement = (select(Label)
                          .join(LabeledImage, LabeledImage.label_id == Label.id)
                          .where(LabeledImage.image_id == image_id)
                          .order_by(LabeledImage.created_at))
-            results = session.exec(statement)
-            return list(results.all())
+            results = await session.exec(statement)
+            return results.all()
 
     async def get_all(self) -> list[Label]:
-        with self._connection.create_session() as session:
+        async with self._connection.create_async_session() as session:
             statement = select(Label)
-            results = session.exec(statement)
-            return list(results.all())
+            results = await session.exec(statement)
+            return results.all()
 
     async def get_by_name(self, name: str) -> Label | None:
-        with self._connection.create_session() as session:
+        async with self._connection.create_async_session() as session:
             stmt = select(Label).where(Label.name == name).limit(1)
-            label = session.exec(stmt).one_or_none()
+            label = (await session.exec(stmt)).one_or_none()
             return label
 
     # noinspection PyUnresolvedReferences
     async def get_in_names(self, names: Iterable[str]) -> list[Label] | None:
-        with self._connection.create_session() as session:
+        async with self._connection.create_async_session() as session:
             statement = (select(Label)
                          .where(Label.name.in_(names)))
-            return list(session.exec(statement).all())
+            return (await session.exec(statement)).all()
 
     # noinspection PyUnresolvedReferences
     async def assign_labels(self, image: Image, label_ids: Iterable[int]):
-        with self._connection.create_session() as session:
-            statement = select(Label).where(Label.id.in_(label_ids))
-            matched_labels = session.exec(statement).all()
-            for label in matched_labels:
-                db_labeled_image = LabeledImage(label=label, image=image)
-                session.add(db_labeled_image)
-            session.commit()
+        unique_label_ids = set(label_ids)
+        if len(unique_label_ids) == 0:
+            return
+
+        # Insert all rows in a single statement, already assigned labels are skipped
+        # and the existence of the labels is checked by the foreign key constraint.
+        now = get_datetime_now()
+        rows = [{"label_id": label_id, "image_id": image.id, "created_at": now} for label_id in unique_label_ids]
+        statement = pg_insert(LabeledImage).on_conflict_do_nothing(index_elements=["label_id", "image_id"])
+        async with self._connection.create_async_session() as session:
+            try:
+                await session.exec(statement, params=rows)
+                await session.commit()
+            except IntegrityError as e:
+                await session.rollback()
+                raise NotFoundError(f'Image {image.id} or some of labels with ids {sorted(unique_label_ids)} '
+                                    f'do not exist.') from e
@@ -18,11 +18,9 @@ class ThreadRepositoryImpl(IThreadRepository, RepositoryImpl):
 
     async def get_all_by_user_id(self, user_id: UUID, params: PagingParams) -> PagingWrapper[Thread]:
         with self._connection.create_session() as session:
-            count_statement = (select(func.count())
-                               .where(Thread.user_id == user_id))
-            execute_statement = (select(Thread)
+            execute_statement = (select(Thread, func.count().over().label("total_elements"))
                                  .where(Thread.user_id == user_id)
                                  .offset(params.offset * params.limit)
                                  .limit(params.limit)
                                  .order_by(Thread.created_at))
-            return PagingWrapper.get_paging(params, count_statement, execute_statement, session)
+            return PagingWrapper.get_paging(params, execute_statement, session)
@@ -1,5 +1,6 @@
 import asyncio
 from typing import Annotated
+from uuid import UUID
 
 from dependency_injector.wiring import inject
 from fastapi import APIRouter, UploadFile, status, File, Form
@@ -13,7 +14,6 @@ from ..service.interface.file import IFileService
 from ..util import FileInformation, PagingWrapper
 from ..util.constant import SUPPORTED_DOCUMENT_TYPE_DICT
 from ..util.error import NotFoundError, InvalidArgumentError
-from ..util.function import strict_uuid_parser
 
 
 async def to_doc_public(db_doc: Document, file_service: IFileService):
@@ -45,11 +45,11 @@ router = APIRouter(
 
 @router.get("/{document_id}/token", status_code=status.HTTP_200_OK)
 @inject
-async def get_download_token(document_id: str,
+async def get_download_token(document_id: UUID,
                              service: DocumentServiceDepend,
                              file_service: FileServiceDepend,
                              generator: DownloadGeneratorDepend) -> str:
-    db_doc = await service.get_document_by_id(strict_uuid_parser(document_id))
+    db_doc = await service.get_document_by_id(document_id)
     if db_doc.source == DocumentSource.EXTERNAL:
         raise InvalidArgumentError(f'Cannot download document because the document is from external source.')
     file = await file_service.get_metadata_by_id(db_doc.file_id)
@@ -66,9 +66,8 @@ async def get_download_token(document_id: str,
 
 @router.get("/{document_id}/info", response_model=DocumentPublic, status_code=status.HTTP_200_OK)
 @inject
-async def get_information(document_id: str, service: DocumentServiceDepend, file_service: FileServiceDepend):
-    doc_uuid = strict_uuid_parser(document_id)
-    doc = await service.get_document_by_id(doc_uuid)
+async def get_information(document_id: UUID, service: DocumentServiceDepend, file_service: FileServiceDepend):
+    doc = await service.get_document_by_id(document_id)
     return await to_doc_public(doc, file_service)
 
 
@@ -107,12 +106,11 @@ async def upload(file: Annotated[UploadFile, File()],
 
 @router.post("/{store_name}/embed/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-async def embed(store_name: str, document_id: str,
+async def embed(store_name: str, document_id: UUID,
                 service: DocumentServiceDepend,
                 file_service: FileServiceDepend,
                 agent_service: AgentServiceDepend) -> None:
-    doc_uuid = strict_uuid_parser(document_id)
-    db_doc = await service.get_document_by_id(doc_uuid)
+    db_doc = await service.get_document_by_id(document_id)
     file = await file_service.get_metadata_by_id(db_doc.file_id)
 
     async def embed_document():
@@ -124,7 +122,7 @@ async def embed(store_name: str, document_id: str,
                     "path": file.path,
                     "mime_type": file.mime_type,
                 })
-            await service.embed_document(store_name=store_name, doc_id=doc_uuid, chunk_ids=chunk_ids)
+            await service.embed_document(store_name=store_name, doc_id=document_id, chunk_ids=chunk_ids)
         except ValueError:
             raise NotFoundError(f'Do not have vector store with name {store_name}')
 
@@ -134,14 +132,13 @@ async def embed(store_name: str, document_id: str,
 
 @router.delete("/{document_id}/unembed", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-async def unembed(document_id: str, service: DocumentServiceDepend, agent_service: AgentServiceDepend) -> None:
-    doc_uuid = strict_uuid_parser(document_id)
-    db_doc = await service.get_document_by_id(doc_uuid)
+async def unembed(document_id: UUID, service: DocumentServiceDepend, agent_service: AgentServiceDepend) -> None:
+    db_doc = await service.get_document_by_id(document_id)
     store_name = db_doc.embed_to_vs
     if store_name is None:
         raise NotFoundError(f'Document {db_doc.name} has not been embedded to vector store.')
 
-    chunk_ids = await service.unembed_document(doc_id=doc_uuid)
+    chunk_ids = await service.unembed_document(doc_id=document_id)
 
     try:
         await agent_service.unembed_document(store_name=store_name, chunk_ids=chunk_ids)
@@ -151,6 +148,5 @@ async def unembed(document_id: str, service: DocumentServiceDepend, agent_servic
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-async def delete(document_id: str, document_service: DocumentServiceDepend) -> None:
-    doc_uuid = strict_uuid_parser(document_id)
-    await document_service.delete_document_by_id(doc_uuid)
+async def delete(document_id: UUID, document_service: DocumentServiceDepend) -> None:
+    await document_service.delete_document_by_id(document_id)
@@ -1,10 +1,11 @@
+from uuid import UUID
+
 from dependency_injector.wiring import inject
 from fastapi import APIRouter, status
 
 from ..data.dto import LabelPublic, LabelCreate, LabelDelete, LabelUpdate
 from ..dependency import LabelServiceDepend
 from ..util.error import InvalidArgumentError
-from ..util.function import strict_uuid_parser
 
 router = APIRouter(
     prefix="/api/v1/labels",
@@ -24,9 +25,8 @@ async def get_labels(service: LabelServiceDepend):
 
 @router.get("/{image_id}/image", response_model=list[LabelPublic], status_code=status.HTTP_200_OK)
 @inject
-async def get_by_image_id(image_id: str, service: LabelServiceDepend):
-    image_uuid = strict_uuid_parser(image_id)
-    return await service.get_labels_by_image_id(image_id=image_uuid)
+async def get_by_image_id(image_id: UUID, service: LabelServiceDepend):
+    return await service.get_labels_by_image_id(image_id=image_id)
 
 
 @router.get("/{label_id}", response_model=LabelPublic, status_code=status.HTTP_200_OK)
@@ -1,5 +1,5 @@
 import asyncio
-import math
+from contextlib import aclosing
 from typing import Literal, Annotated
 from uuid import UUID
 
@@ -22,8 +22,10 @@ from ..util.function import strict_uuid_parser, is_web_path, get_cache_dir_path
 async def get_all_messages_from_thread(thread_id: UUID, params: PagingParams,
                                        agent_service: IAgentService) -> PagingWrapper:
     config: RunnableConfig = {"configurable": {"thread_id": str(thread_id)}}
-    states = await agent_service.get_state_history(config, limit=1)
-    if len(states) < 1:
+    # Close the history generator right away, only its first state is needed
+    async with aclosing(agent_service.get_state_history(config, limit=1)) as states:
+        latest_state = await anext(states, None)
+    if latest_state is None:
         return PagingWrapper(
             content=[],
             first=True,
@@ -34,10 +36,10 @@ async def get_all_messages_from_thread(thread_id: UUID, params: PagingParams,
             total_elements=0
         )
 
-    messages: list[BaseMessage] = states[0].values["messages"][::-1]
+    messages: list[BaseMessage] = latest_state.values["messages"][::-1]
     messages_len = len(messages)
 
-    total_pages = math.ceil(messages_len / params.limit)
+    total_pages = (messages_len + params.limit - 1) // params.limit
     start_idx = params.offset * params.limit
     end_idx = min(start_idx + params.limit, messages_len)
     return PagingWrapper(
@@ -63,40 +65,40 @@ router = APIRouter(
 
 @router.get(path="/{user_id}/all", response_model=PagingWrapper[ThreadPublic], status_code=status.HTTP_200_OK)
 @inject
-async def get_all_threads(user_id: str, params: PagingQuery, service: ThreadServiceDepend):
-    return await service.get_all_threads_by_user_id(user_id=strict_uuid_parser(user_id), params=params)
+async def get_all_threads(user_id: UUID, params: PagingQuery, service: ThreadServiceDepend):
+    return await service.get_all_threads_by_user_id(user_id=user_id, params=params)
 
 
 @router.get("/{thread_id}", response_model=ThreadPublic, status_code=status.HTTP_200_OK)
 @inject
-async def get_by_id(thread_id: str, service: ThreadServiceDepend):
-    return await service.get_thread_by_id(strict_uuid_parser(thread_id))
+async def get_by_id(thread_id: UUID, service: ThreadServiceDepend):
+    return await service.get_thread_by_id(thread_id)
 
 
 @router.get(path="/{thread_id}/messages", response_model=PagingWrapper, status_code=status.HTTP_200_OK)
 @inject
-async def get_all_messages(thread_id: str, params: PagingQuery, agent_service: AgentServiceDepend):
+async def get_all_messages(thread_id: UUID, params: PagingQuery, agent_service: AgentServiceDepend):
     """Get all messages in a thread"""
-    return await get_all_messages_from_thread(thread_id=strict_uuid_parser(thread_id),
+    return await get_all_messages_from_thread(thread_id=thread_id,
                                               params=params, agent_service=agent_service)
 
 
 @router.post(path="/{user_id}/create", status_code=status.HTTP_201_CREATED)
 @inject
-async def create_thread(user_id: str, data: ThreadCreate, service: ThreadServiceDepend) -> str:
-    thread = await service.create_thread(user_id=strict_uuid_parser(user_id), data=data)
+async def create_thread(user_id: UUID, data: ThreadCreate, service: ThreadServiceDepend) -> str:
+    thread = await service.create_thread(user_id=user_id, data=data)
     return str(thread.id)
 
 
 @router.put(path="/{thread_id}/update", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-async def update_thread(thread_id: str, data: ThreadUpdate, service: ThreadServiceDepend) -> None:
-    await service.update_thread(thread_id=strict_uuid_parser(thread_id), data=data)
+async def update_thread(thread_id: UUID, data: ThreadUpdate, service: ThreadServiceDepend) -> None:
+    await service.update_thread(thread_id=thread_id, data=data)
 
 
 @router.post(path="/{thread_id}/messages", status_code=status.HTTP_200_OK)
 @inject
-async def append_message(thread_id: str,
+async def append_message(thread_id: UUID,
                          input_msg: InputMessage,
                          stream_mode: Annotated[Literal["values", "updates", "messages"], Query()],
                          file_service: FileServiceDepend,
@@ -106,7 +108,7 @@ async def append_message(thread_id: str,
     if input_msg.attachment_id is None and len(input_msg.content.strip()) == 0:
         raise InvalidArgumentError("Attachment and content cannot be empty at the same time.")
 
-    await thread_service.get_thread_by_id(strict_uuid_parser(thread_id))
+    await thread_service.get_thread_by_id(thread_id)
     attachment: Attachment | None = None
     attachment_id = input_msg.attachment_id
     if attachment_id is not None:
@@ -126,7 +128,7 @@ async def append_message(thread_id: str,
                 },
                 stream_mode=stream_mode,
                 config={
-                    "configurable": {"thread_id": thread_id},
+                    "configurable": {"thread_id": str(thread_id)},
                     # "recursion_limit": 5,
                 }
         ):
@@ -153,21 +155,21 @@ async def append_message(thread_id: str,
 
 @router.delete(path="/{thread_id}/delete", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-async def delete(thread_id: str, service: ThreadServiceDepend) -> None:
-    await service.delete_thread_by_id(strict_uuid_parser(thread_id))
+async def delete(thread_id: UUID, service: ThreadServiceDepend) -> None:
+    await service.delete_thread_by_id(thread_id)
 
 
 @router.get("/attachment/{attachment_id}/metadata",
             response_model=AttachmentPublic,
             status_code=status.HTTP_200_OK)
 @inject
-async def get_attachment_metadata(attachment_id: str, request: Request, service: FileServiceDepend):
-    file = await service.get_metadata_by_id(strict_uuid_parser(attachment_id))
+async def get_attachment_metadata(attachment_id: UUID, request: Request, service: FileServiceDepend):
+    file = await service.get_metadata_by_id(attachment_id)
     if file is None:
         raise NotFoundError(f"Attachment with id {attachment_id} not found.")
 
     return AttachmentPublic(
-        id=attachment_id,
+        id=str(attachment_id),
         name=file.name,
         mime_type=file.mime_type,
         url=str(request.url).replace('/metadata', ''))
@@ -175,15 +177,15 @@ async def get_attachment_metadata(attachment_id: str, request: Request, service:
 
 @router.get("/attachment/{attachment_id}", status_code=status.HTTP_200_OK)
 @inject
-async def get_attachment(attachment_id: str, service: FileServiceDepend):
-    file = await service.get_metadata_by_id(strict_uuid_parser(attachment_id))
+async def get_attachment(attachment_id: UUID, service: FileServiceDepend):
+    file = await service.get_metadata_by_id(attachment_id)
     if file is None:
         raise NotFoundError(f"Attachment with id {attachment_id} not found.")
     path = file.path
     if is_web_path(path):
         cache_dir = get_cache_dir_path()
         cache_dir.mkdir(parents=True, exist_ok=True)
-        cached_file = cache_dir.joinpath(attachment_id)
+        cached_file = cache_dir.joinpath(str(attachment_id))
         if not cached_file.exists():
             async with aiohttp.ClientSession() as session:
                 response = await session.get(path)
@@ -194,26 +196,25 @@ async def get_attachment(attachment_id: str, service: FileServiceDepend):
 
 @router.post(path="/attachment/{thread_id}/upload", status_code=status.HTTP_200_OK)
 @inject
-async def upload_attachment(thread_id: str, file: UploadFile,
+async def upload_attachment(thread_id: UUID, file: UploadFile,
                             service: ThreadServiceDepend,
                             image_service: ImageServiceDepend,
                             agent_service: AgentServiceDepend,
                             file_service: FileServiceDepend) -> str:
-    file_bytes = await file.read()
     if "image" in file.content_type:
         image = await image_service.save_image(ImageCreate(name=file.filename,
                                                            mime_type=file.content_type,
-                                                           data=file_bytes))
+                                                           read=file.read))
         attachment_id = image.file_id
 
         img_recognizer = agent_service.configurer.image_recognizer
         if img_recognizer is not None:
             from .image import predict_labels
-            asyncio.create_task(predict_labels(img_recognizer, file_bytes, image.id, image_service))
+            asyncio.create_task(predict_labels(img_recognizer, image, image_service, file_service))
     else:
-        file = await file_service.save_file(IFileService.SaveFile(name=file.filename,
-                                                                  mime_type=file.content_type,
-                                                                  data=file_bytes))
+        file = await file_service.save_file_stream(IFileService.StreamFile(name=file.filename,
+                                                                           mime_type=file.content_type,
+                                                                           read=file.read))
         attachment_id = file.id
 
     await service.add_attachments(thread_id, [attachment_id])
@@ -222,5 +223,5 @@ async def upload_attachment(thread_id: str, file: UploadFile,
 
 @router.delete(path="/attachment/{attachment_id}", status_code=status.HTTP_204_NO_CONTENT)
 @inject
-async def delete_attachment(attachment_id: str, service: ThreadServiceDepend) -> None:
-    await service.delete_attachment_by_id(strict_uuid_parser(attachment_id))
+async def delete_attachment(attachment_id: UUID, service: ThreadServiceDepend) -> None:
+    await service.delete_attachment_by_id(attachment_id)
@@ -1,32 +1,53 @@
 import asyncio
+import itertools
 import logging
+import string
 from logging import Logger
 from typing import Literal
 from uuid import uuid4
 
 from docling.document_converter import DocumentConverter
 from langchain_core.documents import Document
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage, SystemMessage, BaseMessageChunk, message_chunk_to_message
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.runnables import RunnableConfig
-from langchain_experimental.text_splitter import SemanticChunker
 from langgraph.constants import END, START
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import ToolNode, tools_condition
-from langgraph.types import StateSnapshot, RetryPolicy
+from langgraph.types import RetryPolicy
 
+from src.config.configurer.embeddings import get_semantic_chunker, clear_semantic_chunkers
 from src.config.configurer.interface.agent import AgentConfigurer
 from src.service.interface.agent import Attachment, StateConfiguration, State, AgentMetadata, IAgentService
 from src.util import FileInformation, Progress
 from src.util.constant import SUPPORTED_LANGUAGE_DICT
 
+ATTACHMENT_INSTRUCTION = string.Template(
+    "You are given an attachment. You should analysis based on the following steps:\n"
+    "*Step 1. Specify what attachment type you have by looking at a MIME type of the attachment.\n"
+    "Step 2. Select the correct recognition tool to use based on the attachment type.\n"
+    "Step 3. Call the selected recognition tool.*\n"
+    "**IMPORTANT NOTICE:**"
+    "1. If you don't have compatible tools, you MUST say that you don't have "
+    "compatible tools to recognize the attachment.\n"
+    "2. Remember to tell us what you are doing.\n"
+    "3. You MUST NOT say the details of the provided attachment.\n"
+    "The attachment information goes here: $attachment"
+)
+EMBED_BATCH_SIZE = 64
+EMBED_MAX_CONCURRENT_BATCHES = 4
+
 
 class Agent(IAgentService):
+    __slots__ = ("_status", "_configurer", "_graph", "_is_configured", "_prompt_cache", "_vector_store_names",
+                 "_logger")
     _status: Literal["ON", "OFF", "RESTART", "EMBED_DOCUMENT"]
     _configurer: AgentConfigurer
     _graph: CompiledStateGraph | None
     _is_configured: bool
+    _prompt_cache: dict[str, ChatPromptTemplate]
+    _vector_store_names: list[str]
     _logger: Logger
 
     def __init__(self, configurer: AgentConfigurer):
@@ -34,6 +55,8 @@ class Agent(IAgentService):
         self._configurer = configurer
         self._graph = None
         self._is_configured = False
+        self._prompt_cache = {}
+        self._vector_store_names = []
         self._logger = logging.getLogger(__name__)
 
     def stream(self, input_state, config=None, *, stream_mode=None):
@@ -72,10 +95,8 @@ class Agent(IAgentService):
         self.check_graph_available()
 
         graph: CompiledStateGraph = self._graph
-        states: list[StateSnapshot] = []
         async for state in graph.aget_state_history(config, filter=use_filter, before=before, limit=limit):
-            states.append(state)
-        return states
+            yield state
 
     def get_state(self, config, *, sub_graphs=False):
         self.check_graph_available()
@@ -95,6 +116,8 @@ class Agent(IAgentService):
             return
         self._logger.info("Configuring agent...")
         await self._configurer.async_configure()
+        self._build_prompt_cache()
+        self._cache_vector_store_names()
         self._is_configured = True
         self._logger.info("Agent configured successfully!")
 
@@ -125,6 +148,7 @@ class Agent(IAgentService):
         yield statuses[0]
 
         self._status = "RESTART"
+        clear_semantic_chunkers()  # embeddings models are recreated when reconfiguring
         await self.configure(force=True)
         yield statuses[1]
         self.build_graph()
@@ -138,9 +162,9 @@ class Agent(IAgentService):
         Embeds a document into a specified vector store.
 
         This method takes a document's file information, loads it, splits it into
-        chunks, and then embeds these chunks into the designated vector store.
-        It generates unique UUIDs for each chunk to serve as their identifiers
-        within the vector store.
+        chunks, and then embeds these chunks into the designated vector store
+        in concurrent batches of `EMBED_BATCH_SIZE` chunks. It generates unique
+        UUIDs for each chunk to serve as their identifiers within the vector store.
 
         Args:
             store_name (str): The name of the vector store where the document
@@ -167,7 +191,7 @@ class Agent(IAgentService):
             document = Document(page_content=result.document.export_to_markdown(),
                                 metadata={"source": doc_path, "total_pages": len(result.pages)})
 
-            chunker = SemanticChunker(vector_store.embeddings)
+            chunker = get_semantic_chunker(vector_store.embeddings)
             self._logger.debug(f'Splitting documents by using semantic similarity...')
 
             def split_docs():
@@ -176,8 +200,24 @@ class Agent(IAgentService):
             chunks = await asyncio.to_thread(split_docs)
 
             self._logger.debug(f'Adding chunks to vector store {store_name}...')
-            uuids = [str(uuid4()) for _ in range(len(chunks))]
-            added_ids = await vector_store.aadd_documents(documents=chunks, ids=uuids)
+            batches = [chunks[i:i + EMBED_BATCH_SIZE] for i in range(0, len(chunks), EMBED_BATCH_SIZE)]
+            semaphore = asyncio.Semaphore(EMBED_MAX_CONCURRENT_BATCHES)
+
+            async def add_batch(batch: list[Document]):
+                async with semaphore:
+                    return await vector_store.aadd_documents(documents=batch, ids=[str(uuid4()) for _ in batch])
+
+            results = await asyncio.gather(*[add_batch(batch) for batch in batches], return_exceptions=True)
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if len(errors) > 0:
+                # The ids are not returned to the caller, so the added batches are removed to not orphan them
+                added_results = [r for r in results if not isinstance(r, BaseException)]
+                orphan_ids = list(itertools.chain.from_iterable(added_results))
+                if len(orphan_ids) > 0:
+                    self._logger.debug(f'Removing {len(orphan_ids)} chunks of the failed document...')
+                    await vector_store.adelete(ids=orphan_ids)
+                raise errors[0]
+            added_ids = list(itertools.chain.from_iterable(results))
 
             self._logger.debug("Document embedded successfully!")
         else:
@@ -233,45 +273,70 @@ class Agent(IAgentService):
         if self._status == "RESTART":
             raise RuntimeError("The agent is restarting.")
 
+    def _build_prompt_cache(self):
+        """
+        Pre-builds the prompt templates used by the graph nodes, so that they are
+        constructed once per configuration instead of on every invocation.
+        """
+        lang_name = SUPPORTED_LANGUAGE_DICT[self._configurer.config.language]
+        language_message = SystemMessage(content=f'Your primary language is {lang_name}.')
+        self._prompt_cache = {
+            "with_attachment": ChatPromptTemplate.from_messages([
+                MessagesPlaceholder(variable_name="messages"),
+                language_message,
+                MessagesPlaceholder(variable_name="instruction"),
+            ]),
+            "plain_respond": ChatPromptTemplate.from_messages([
+                language_message,
+                SystemMessage(content=self._configurer.config.prompt.respond_prompt),
+                MessagesPlaceholder(variable_name="messages"),
+            ]),
+        }
+
+    def _cache_vector_store_names(self):
+        """
+        Caches the names of the configured vector stores, they only change when the agent is (re)configured.
+        """
+        vs_configurer = self._configurer.vector_store_configurer
+        if vs_configurer is None:
+            self._vector_store_names = []
+        else:
+            self._vector_store_names = [config.name for config in vs_configurer.get_all_configs()]
+
     async def _query_or_respond(self, state: State, config: RunnableConfig):
-        lang = self._configurer.config.language
         messages = state["messages"]
         self._logger.debug(f"Received messages: {messages}")
         latest_message = messages[-1]
 
-        if ("attachment" in latest_message.additional_kwargs
-                and latest_message.additional_kwargs["attachment"] is not None):
-            attachment: Attachment = latest_message.additional_kwargs["attachment"]
-            prompt_template = ChatPromptTemplate.from_messages([
-                MessagesPlaceholder(variable_name="messages"),
-                SystemMessage(content=f'Your primary language is {SUPPORTED_LANGUAGE_DICT[lang]}.'),
-                HumanMessage(
-                    content="You are given an attachment. You should analysis based on the following steps:\n"
-                            "*Step 1. Specify what attachment type you have by looking at a MIME type of the attachment.\n"
-                            "Step 2. Select the correct recognition tool to use based on the attachment type.\n"
-                            "Step 3. Call the selected recognition tool.*\n"
-                            "**IMPORTANT NOTICE:**"
-                            "1. If you don't have compatible tools, you MUST say that you don't have "
-                            "compatible tools to recognize the attachment.\n"
-                            "2. Remember to tell us what you are doing.\n"
-                            "3. You MUST NOT say the details of the provided attachment.\n"
-                            f"The attachment information goes here: {attachment.model_dump_json()}"),
-            ])
+        attachment: Attachment | None = latest_message.additional_kwargs.get("attachment")
+        if attachment is not None:
+            instruction = ATTACHMENT_INSTRUCTION.substitute(attachment=attachment.model_dump_json())
+            prompt_template = self._prompt_cache["with_attachment"]
+            prompt_input = {"messages": messages, "instruction": [HumanMessage(content=instruction)]}
         else:
-            prompt_template = ChatPromptTemplate.from_messages([
-                SystemMessage(content=f'Your primary language is {SUPPORTED_LANGUAGE_DICT[lang]}.'),
-                SystemMessage(content=self._configurer.config.prompt.respond_prompt),
-                MessagesPlaceholder(variable_name="messages"),
-            ])
+            prompt_template = self._prompt_cache["plain_respond"]
+            prompt_input = {"messages": messages}
 
-        prompt = await prompt_template.ainvoke({"messages": messages}, config)
+        prompt = await prompt_template.ainvoke(prompt_input, config)
         self._logger.debug(f'Constructed prompt:\n{prompt}\n')
 
-        response = await self._configurer.chat_model.ainvoke(prompt, config)
+        response = await self._stream_llm(prompt, config)
         self._logger.debug(f"Response: {response}")
 
         return {"messages": [response]}
 
+    async def _stream_llm(self, prompt, config: RunnableConfig):
+        """
+        Calls the chat model in streaming mode, so that the model server emits tokens as soon
+        as they are generated, and merges the streamed chunks into the final message.
+        """
+        response: BaseMessageChunk | None = None
+        async for chunk in self._configurer.chat_model.astream(prompt, config):
+            response = chunk if response is None else response + chunk
+        if response is None:
+            raise RuntimeError("The chat model returned an empty response.")
+        return message_chunk_to_message(response)
+
     def set_status(self, value: Literal["ON", "OFF"]):
         self._status = value
 
@@ -284,18 +349,11 @@ class Agent(IAgentService):
         bm25_configurer = self._configurer.bm25_configurer
         bm25_last_sync = bm25_configurer.last_sync if bm25_configurer is not None else None
 
-        vs_configurer = self._configurer.vector_store_configurer
-        if vs_configurer is None:
-            available_vector_stores = []
-        else:
-            all_store_configs = vs_configurer.get_all_configs()
-            available_vector_stores = [config.name for config in all_store_configs]
-
         return AgentMetadata(name=self._configurer.config.agent_name,
                              description=self._configurer.config.description,
                              status=self._status,
                              bm25_last_sync=bm25_last_sync,
-                             available_vector_stores=available_vector_stores)
+                             available_vector_stores=self._vector_store_names)
 
     @property
     def is_configured(self):
@@ -1,13 +1,18 @@
+import asyncio
+import functools
 import os
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from .interface.file import IFileService
 from ..data.model import File
 from ..repository.interface.file import IFileRepository
 from ..util.constant import EnvVar
+from ..util.error import InvalidArgumentError
 from ..util.function import shrink_file_name
 
+STREAM_CHUNK_SIZE = 1 << 20  # 1 MiB
+
 
 class LocalFileService(IFileService):
     _file_repository: IFileRepository
@@ -20,7 +25,10 @@ class LocalFileService(IFileService):
         db_file = await self._file_repository.get_by_id(file_id)
         if db_file is None:
             return None
-        return self.FileMetadata(id=file_id, name=db_file.name,
+        return self.to_metadata(db_file)
+
+    def to_metadata(self, db_file):
+        return self.FileMetadata(id=db_file.id, name=db_file.name,
                                  mime_type=db_file.mime_type,
                                  path=db_file.save_path)
 
@@ -36,16 +44,38 @@ class LocalFileService(IFileService):
         file_id = uuid4()
         save_path = Path(self.get_save_dir_path(), str(file_id))
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        save_path.write_bytes(file.data)
-        file_name = shrink_file_name(255, file.name)
+        await asyncio.to_thread(save_path.write_bytes, file.data)
+        return await self._save_metadata(file_id, file.name, file.mime_type, save_path)
+
+    async def save_file_stream(self, file):
+        file_id = uuid4()
+        save_path = Path(self.get_save_dir_path(), str(file_id))
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        written_bytes = 0
+        # Disk writes run in worker threads, so the event loop is not blocked by them
+        try:
+            with await asyncio.to_thread(open, save_path, "wb") as out:
+                while chunk := await file.read(STREAM_CHUNK_SIZE):
+                    await asyncio.to_thread(out.write, chunk)
+                    written_bytes += len(chunk)
+        except BaseException:
+            # Do not keep a partially written file, e.g. when the client disconnects or the disk is full
+            save_path.unlink(missing_ok=True)
+            raise
+        if written_bytes == 0:
+            save_path.unlink()
+            raise InvalidArgumentError(f'File {file.name} is empty.')
+        return await self._save_metadata(file_id, file.name, file.mime_type, save_path)
 
+    async def _save_metadata(self, file_id: UUID, name: str, mime_type: str | None, save_path: Path):
+        file_name = shrink_file_name(255, name)
         await self._file_repository.save(File(id=file_id,
                                               name=file_name,
-                                              mime_type=file.mime_type,
+                                              mime_type=mime_type,
                                               save_path=str(save_path)))
         return self.FileMetadata(id=file_id,
                                  name=file_name,
-                                 mime_type=file.mime_type,
+                                 mime_type=mime_type,
                                  path=str(save_path))
 
     async def delete_file_by_id(self, file_id):
@@ -57,5 +87,6 @@ class LocalFileService(IFileService):
                                  mime_type=deleted_file.mime_type, path=deleted_file.save_path)
 
     @staticmethod
+    @functools.cache
     def get_save_dir_path():
         return os.getenv(EnvVar.SAVE_FILE_DIR.value, "/rag_agent/resource")
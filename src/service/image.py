@@ -38,8 +38,8 @@ class ImageServiceImpl(IImageService):
         return await self._image_repository.get_labeled(params)
 
     async def save_image(self, data):
-        file = IFileService.SaveFile(name=data.name, data=data.data, mime_type=data.mime_type)
-        file_metadata = await self._file_service.save_file(file)
+        file = IFileService.StreamFile(name=data.name, read=data.read, mime_type=data.mime_type)
+        file_metadata = await self._file_service.save_file_stream(file)
         return await self._image_repository.save(Image(file_id=file_metadata.id))
 
     async def delete_image_by_id(self, image_id):
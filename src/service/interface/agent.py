@@ -1,6 +1,6 @@
 import datetime
 from abc import ABC, abstractmethod
-from typing import Literal, Any, TypedDict, Sequence
+from typing import Literal, Any, TypedDict, Sequence, AsyncIterator
 from uuid import UUID
 
 from langchain_core.runnables import RunnableConfig
@@ -36,6 +36,7 @@ class AgentMetadata(BaseModel):
 
 
 class IAgentService(ABC):
+    __slots__ = ()
 
     @abstractmethod
     def stream(self, input_state: State, config: RunnableConfig | None = None, *,
@@ -67,16 +68,16 @@ class IAgentService(ABC):
         pass
 
     @abstractmethod
-    async def get_state_history(self,
-                                config: RunnableConfig,
-                                *,
-                                use_filter: dict[str, Any] | None = None,
-                                before: RunnableConfig | None = None,
-                                limit: int | None = None) -> list[StateSnapshot]:
+    def get_state_history(self,
+                          config: RunnableConfig,
+                          *,
+                          use_filter: dict[str, Any] | None = None,
+                          before: RunnableConfig | None = None,
+                          limit: int | None = None) -> AsyncIterator[StateSnapshot]:
         """
         Retrieve the state history for the current graph based on the provided
-        parameters. This method operates asynchronously and returns a sequence
-        of state snapshots, filtering the results if specified. The method will
+        parameters. This method operates asynchronously and lazily yields
+        state snapshots, filtering the results if specified. The method will
         check the availability of the graph before attempting to fetch the state
         history.
 
@@ -89,7 +90,7 @@ class IAgentService(ABC):
         :param limit: An integer defining the maximum number of states to be
             returned. If None, all available states up to the specified
             conditions will be fetched.
-        :return: A sequence containing the state snapshots corresponding to the
+        :return: An async iterator yielding the state snapshots corresponding to the
             specified configuration and filter criteria.
         """
         pass
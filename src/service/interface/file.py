@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, Awaitable
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from src.data.model import File as DbFile
+
 
 class IFileService(ABC):
     class FileMetadata(BaseModel):
@@ -45,6 +47,22 @@ class IFileService(ABC):
         data: bytes = Field(min_length=1, description="File content in bytes")
         kwargs: dict[str, Any] | None = Field(default=None, description="Additional metadata.")
 
+    class StreamFile(BaseModel):
+        """
+        Represents a file to be saved whose content is read chunk by chunk,
+        so that the whole content does not need to be loaded into memory.
+
+        :ivar name: Name of the file.
+        :ivar mime_type: MIME type of the file.
+        :ivar read: An async function which reads at most the given number of bytes,
+            an empty bytes object is returned when the content is exhausted.
+        :ivar kwargs: Additional metadata.
+        """
+        name: str = Field(min_length=1, description="Name of the file.")
+        mime_type: str | None = Field(default=None, min_length=1, description="MIME type of the file.")
+        read: Callable[[int], Awaitable[bytes]] = Field(description="Async function reading the file content.")
+        kwargs: dict[str, Any] | None = Field(default=None, description="Additional metadata.")
+
     @abstractmethod
     async def get_metadata_by_id(self, file_id: UUID) -> FileMetadata | None:
         """
@@ -61,6 +79,18 @@ class IFileService(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def to_metadata(self, db_file: DbFile) -> FileMetadata:
+        """
+        Convert a file entity, e.g. one loaded together with its owner, to a metadata object
+        without querying it again.
+
+        :param db_file: The file entity to convert.
+        :return: Metadata object containing file details.
+        :raises NotImplementedError: If the method is not implemented in a subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_file_by_id(self, file_id: UUID) -> File | None:
         """
@@ -89,6 +119,19 @@ class IFileService(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def save_file_stream(self, file: StreamFile) -> FileMetadata:
+        """
+        Saves the provided file by streaming its content to the storage in fixed-size chunks.
+        Generates a unique identifier to ensure file uniqueness and constructs a save path dynamically.
+
+        :param file: An object containing the file metadata and a function to read its content.
+        :return: Metadata of the saved file.
+        :raises InvalidArgumentError: If the file content is empty.
+        :raises NotImplementedError: If the method is not implemented in a subclass.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_file_by_id(self, file_id: UUID) -> FileMetadata | None:
         """
@@ -54,7 +54,7 @@ class ThreadServiceImpl(IThreadService):
                 raise NotFoundError(f'Cannot add attachments because thread with id {thread_id} not found.')
 
             stmt = select(File).where(File.id.in_(file_ids))
-            files: list[File] = list(session.exec(stmt).all())
+            files: list[File] = session.exec(stmt).all()
             db_thread.attachments += files
             session.add(db_thread)
             session.commit()
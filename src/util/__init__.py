@@ -2,9 +2,9 @@ import asyncio
 import base64
 import hashlib
 import hmac
-import math
 import re
 import secrets
+import string
 import time
 
 from os import PathLike
@@ -12,8 +12,8 @@ from pathlib import Path
 from typing import TypedDict, Callable, Self
 
 from pydantic import BaseModel, Field
-from sqlalchemy import Select
-from sqlmodel import Session
+from sqlalchemy import Select, func
+from sqlmodel import Session, select
 
 from src.util.constant import DEFAULT_CHARSET, DEFAULT_TOKEN_SEPARATOR, EMOTICONS
 
@@ -21,6 +21,30 @@ __all__ = ['error', 'FileInformation', "SecureDownloadGenerator", "Progress", "c
            "PagingWrapper", "TextPreprocessing"]
 
 
+_EMOJI_PATTERN = re.compile("["
+                            u"\U0001F600-\U0001F64F"  # emoticons
+                            u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+                            u"\U0001F680-\U0001F6FF"  # transport & map symbols
+                            u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+                            u"\U00002500-\U00002BEF"  # chinese char
+                            u"\U00002702-\U000027B0"
+                            u"\U00002702-\U000027B0"
+                            u"\U000024C2-\U0001F251"
+                            u"\U0001f926-\U0001f937"
+                            u"\U00010000-\U0010ffff"
+                            u"\u2640-\u2642"
+                            u"\u2600-\u2B55"
+                            u"\u200d"
+                            u"\u23cf"
+                            u"\u23e9"
+                            u"\u231a"
+                            u"\ufe0f"  # dingbats
+                            u"\u3030"
+                            "]+", flags=re.UNICODE)
+_EMOTICON_PATTERN = re.compile(u'(' + u'|'.join(re.escape(k) for k in EMOTICONS) + u')')
+_PUNCTUATION_CLASS = f'[{re.escape(string.punctuation)}]+'
+
+
 class FileInformation(TypedDict):
     """File information dictionary"""
     name: str
@@ -111,44 +135,65 @@ class Progress(TypedDict):
 
 
 class TextPreprocessing:
-    _removal_words: list[str]
+    _removal_words: set[str]
 
     def __init__(self, removal_words_path: str | PathLike[str]):
         super().__init__()
         all_words = Path(removal_words_path).read_text(encoding=DEFAULT_CHARSET)
-        self._removal_words = all_words.split('\n')
+        self._removal_words = set(all_words.split('\n'))
+
+    @staticmethod
+    def build_strip_pattern(remove_emoji: bool = False) -> re.Pattern[str]:
+        """
+        Builds a single pattern which strips punctuations, and optionally emoji,
+        so that a text can be cleaned in one pass instead of chaining the removal functions.
+        Punctuations and emoji do not share any character, so the result is the same as removing them one by one.
+
+        :param remove_emoji: Whether emoji should be stripped.
+        :return: The compiled pattern.
+        """
+        alternatives = [_PUNCTUATION_CLASS]
+        if remove_emoji:
+            alternatives.append(_EMOJI_PATTERN.pattern)
+        return re.compile(u'|'.join(alternatives), flags=re.UNICODE)
+
+    @staticmethod
+    def build_tokenizer(remove_emoji: bool = False,
+                        remove_emoticons: bool = False,
+                        helper: "TextPreprocessing | None" = None) -> Callable[[str], list[str]]:
+        """
+        Builds a function which normalizes a text and splits it into words. The text is lowered,
+        punctuations (and emoji) are stripped, then emoticons and removal words are removed.
+
+        :param remove_emoji: Whether emoji should be stripped.
+        :param remove_emoticons: Whether emoticons should be removed.
+        :param helper: A preprocessing helper whose removal words are filtered out, if provided.
+        :return: The tokenizing function.
+        """
+        strip_pattern = TextPreprocessing.build_strip_pattern(remove_emoji=remove_emoji)
+
+        def tokenize(text: str) -> list[str]:
+            normalized_text = strip_pattern.sub('', text.lower())
+            if remove_emoticons:
+                normalized_text = _EMOTICON_PATTERN.sub('', normalized_text)
+            words = normalized_text.split()
+            return helper.filter_words(words) if helper is not None else words
+
+        return tokenize
 
     @staticmethod
     def remove_emoji(text: str) -> str:
-        emoji_pattern = re.compile("["
-                                   u"\U0001F600-\U0001F64F"  # emoticons
-                                   u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-                                   u"\U0001F680-\U0001F6FF"  # transport & map symbols
-                                   u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                                   u"\U00002500-\U00002BEF"  # chinese char
-                                   u"\U00002702-\U000027B0"
-                                   u"\U00002702-\U000027B0"
-                                   u"\U000024C2-\U0001F251"
-                                   u"\U0001f926-\U0001f937"
-                                   u"\U00010000-\U0010ffff"
-                                   u"\u2640-\u2642"
-                                   u"\u2600-\u2B55"
-                                   u"\u200d"
-                                   u"\u23cf"
-                                   u"\u23e9"
-                                   u"\u231a"
-                                   u"\ufe0f"  # dingbats
-                                   u"\u3030"
-                                   "]+", flags=re.UNICODE)
-        return emoji_pattern.sub(r'', text)
+        return _EMOJI_PATTERN.sub(r'', text)
 
     @staticmethod
     def remove_emoticons(text):
-        emoticon_pattern = re.compile(u'(' + u'|'.join(re.escape(k) for k in EMOTICONS) + u')')
-        return emoticon_pattern.sub(r'', text)
+        return _EMOTICON_PATTERN.sub(r'', text)
 
     def remove_words(self, text: str) -> str:
-        return " ".join([word for word in str(text).split() if word not in self._removal_words])
+        return " ".join(self.filter_words(str(text).split()))
+
+    def filter_words(self, words: list[str]) -> list[str]:
+        return [word for word in words if word not in self._removal_words]
 
 
 class PagingParams(BaseModel):
@@ -177,18 +222,39 @@ class PagingWrapper[T](BaseModel):
     def get_paging(
             cls,
             params: PagingParams,
-            count_statement: Select,
             execute_statement: Select,
             session: Session
     ):
-        total_elements = int(session.exec(count_statement).one())
-        total_pages = math.ceil(total_elements / params.limit)
-
-        results = session.exec(execute_statement)
-        return cls(
-            content=list(results.all()),
+        """
+        Executes a paged statement, the total number of elements is selected along with the page rows
+        by a `COUNT(*) OVER ()` window function, so only one query is sent to the database.
+
+        :param params: The paging parameters.
+        :param execute_statement: A statement selecting an entity and
+            `func.count().over().label("total_elements")`, with offset and limit applied.
+            It must not use `DISTINCT`, since the window function is evaluated before it.
+        :param session: The session to execute the statement.
+        :return: The paged result.
+        """
+        assert "total_elements" in execute_statement.selected_columns, \
+            'The paged statement must select func.count().over().label("total_elements").'
+        rows = session.exec(execute_statement).all()
+        if len(rows) > 0:
+            total_elements = int(rows[0].total_elements)
+        elif params.offset == 0:
+            total_elements = 0
+        else:
+            # The requested page is out of range, so count the rows without the paging
+            count_statement = (select(func.count())
+                               .select_from(execute_statement.offset(None).limit(None).order_by(None).subquery()))
+            total_elements = int(session.exec(count_statement).one())
+        total_pages = (total_elements + params.limit - 1) // params.limit
+
+        # The content comes from the database, validating it again is not necessary
+        return cls.model_construct(
+            content=[row[0] for row in rows],
             first=params.offset == 0,
-            last=params.offset == max(total_pages - 1, 0),
+            last=total_elements == 0 or params.offset >= total_pages - 1,
             total_elements=total_elements,
             total_pages=total_pages,
             page_number=params.offset,
@@ -198,7 +264,7 @@ class PagingWrapper[T](BaseModel):
     @classmethod
     def convert_content_type[D](cls, data: Self, map_func: Callable[[T], D]):
         new_content = [map_func(d) for d in data.content]
-        return cls(
+        return cls.model_construct(
             content=new_content,
             first=data.first,
             last=data.last,
@@ -214,7 +280,7 @@ class PagingWrapper[T](BaseModel):
             for d in data.content:
                 tasks.append(tg.create_task(map_func(d)))
         new_content = [t.result() for t in tasks]
-        return cls(
+        return cls.model_construct(
             content=new_content,
             first=data.first,
             last=data.last,
@@ -254,4 +254,5 @@ class EnvVar(str, Enum):
     SAVE_FILE_DIR = "SAVE_FILE_DIR"
     CACHE_DIR = "CACHE_DIR"
     MAX_WORKERS = "MAX_WORKERS"
+    BM25_MAX_WORKERS = "BM25_MAX_WORKERS"
     DOWNLOAD_GENERATOR_SECRET_KEY = "DOWNLOAD_GENERATOR_SECRET_KEY"
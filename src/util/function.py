@@ -1,4 +1,5 @@
 import datetime
+import functools
 import os
 import uuid
 from pathlib import Path
@@ -8,6 +9,7 @@ from .constant import EnvVar, DEFAULT_TIMEZONE
 from ..util.error import InvalidArgumentError
 
 
+@functools.cache
 def get_cache_dir_path():
     return Path(os.getenv(EnvVar.CACHE_DIR, "/rag_agent/cache"))
 
@@ -16,6 +18,7 @@ def get_datetime_now():
     return datetime.datetime.now(DEFAULT_TIMEZONE)
 
 
+@functools.cache
 def get_config_folder_path():
     config_path = os.getenv(EnvVar.AGENT_CONFIG_DIR.value)
     if config_path is None:
@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import func
+from sqlmodel import Field, Session, SQLModel, create_engine, select
+
+from src.util import PagingParams, PagingWrapper
+
+
+class PagedItem(SQLModel, table=True):
+    id: int = Field(primary_key=True)
+
+
+def paged_statement(params: PagingParams):
+    return (select(PagedItem, func.count().over().label("total_elements"))
+            .offset(params.offset * params.limit)
+            .limit(params.limit)
+            .order_by(PagedItem.id))
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(PagedItem(id=i) for i in range(1, 8))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+@pytest.mark.parametrize("offset, ids, first, last", [
+    (0, [1, 2, 3], True, False),
+    (1, [4, 5, 6], False, False),
+    (2, [7], False, True),
+    (5, [], False, True),
+])
+def test_get_paging(session, offset, ids, first, last):
+    params = PagingParams(offset=offset, limit=3)
+    page = PagingWrapper.get_paging(params, paged_statement(params), session)
+
+    assert [item.id for item in page.content] == ids
+    assert page.first == first
+    assert page.last == last
+    assert page.total_elements == 7
+    assert page.total_pages == 3
+    assert page.page_number == offset
+    assert page.page_size == 3
+
+
+def test_get_paging_empty(session):
+    session.exec(PagedItem.__table__.delete())
+    session.commit()
+    params = PagingParams(offset=0, limit=3)
+    page = PagingWrapper.get_paging(params, paged_statement(params), session)
+
+    assert page.content == []
+    assert page.first and page.last
+    assert page.total_elements == 0
+    assert page.total_pages == 0
+
+
+def test_get_paging_requires_window_count(session):
+    params = PagingParams(offset=0, limit=3)
+    with pytest.raises(AssertionError):
+        PagingWrapper.get_paging(params, select(PagedItem).limit(params.limit), session)
@@ -0,0 +1,54 @@
+import string
+
+import pytest
+
+from src.util import TextPreprocessing
+
+TEXTS = [
+    "Updated: Windows XP at 10:30, DXF files",
+    "Password:",
+    "Nice work :-) XD 😀 see you at 8D, oO QQ",
+    "d: 0:3 don't x-y [a]^b\\c",
+    "",
+]
+
+
+def baseline_tokenize(text: str, remove_emoji: bool, remove_emoticons: bool,
+                      helper: TextPreprocessing | None) -> list[str]:
+    """The preprocessing pipeline of the BM25 retriever before the passes were fused."""
+    normalized_text = text.lower().translate(str.maketrans('', '', string.punctuation))
+    if remove_emoji:
+        normalized_text = TextPreprocessing.remove_emoji(normalized_text)
+    if remove_emoticons:
+        normalized_text = TextPreprocessing.remove_emoticons(normalized_text)
+    if helper is not None:
+        normalized_text = helper.remove_words(normalized_text)
+    return normalized_text.split()
+
+
+@pytest.fixture
+def helper(tmp_path):
+    removal_words_path = tmp_path / "removal_words.txt"
+    removal_words_path.write_text("at\nfiles\nsee", encoding="utf-8")
+    return TextPreprocessing(removal_words_path)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("remove_emoji", [False, True])
+@pytest.mark.parametrize("remove_emoticons", [False, True])
+@pytest.mark.parametrize("use_helper", [False, True])
+def test_tokenizer_matches_baseline_pipeline(text, remove_emoji, remove_emoticons, use_helper, helper):
+    removal_helper = helper if use_helper else None
+    tokenize = TextPreprocessing.build_tokenizer(remove_emoji=remove_emoji,
+                                                 remove_emoticons=remove_emoticons,
+                                                 helper=removal_helper)
+
+    assert tokenize(text) == baseline_tokenize(text, remove_emoji, remove_emoticons, removal_helper)
+
+
+def test_tokenizer_keeps_words_containing_emoticons():
+    tokenize = TextPreprocessing.build_tokenizer(remove_emoji=True, remove_emoticons=True)
+
+    assert tokenize("Updated: Windows XP at 10:30, DXF files") == \
+           ['updated', 'windows', 'xp', 'at', '1030', 'dxf', 'files']
+    assert tokenize("Password:") == ['password']